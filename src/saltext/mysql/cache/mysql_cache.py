@@ -47,7 +47,6 @@ value to ``mysql``:
 .. _`MySQL documentation`: https://github.com/coreos/mysql
 """
 
-import copy
 import logging
 import time
 
@@ -129,7 +128,7 @@ def run_query(conn, query, args=None, retries=3):
             log.debug("Doing query: %s", query)
             out = cur.execute(query)
         else:
-            log.debug("Doing query: %s args: %s ", query, repr(args))
+            log.debug("Doing query: %s args: %r ", query, args)
             out = cur.execute(query, args)
 
         return cur, out
@@ -161,6 +160,9 @@ def _create_table():
     """
     Create table if needed
     """
+    db_name = __context__["mysql_kwargs"]["db"]
+    table_name = __context__["mysql_table_name"]
+
     # Explicitly check if the table already exists as the library logs a
     # warning on CREATE TABLE
     query = """SELECT COUNT(TABLE_NAME) FROM information_schema.tables
@@ -168,7 +170,7 @@ def _create_table():
     cur, _ = run_query(
         __context__.get("mysql_client"),
         query,
-        args=(__context__["mysql_kwargs"]["db"], __context__["mysql_table_name"]),
+        args=(db_name, table_name),
     )
     r = cur.fetchone()
     cur.close()
@@ -185,7 +187,7 @@ def _create_table():
         cur, _ = run_query(
             __context__["mysql_client"],
             query,
-            args=(__context__["mysql_kwargs"]["db"], __context__["mysql_table_name"]),
+            args=(db_name, table_name),
         )
         r = cur.fetchone()
         cur.close()
@@ -198,7 +200,7 @@ def _create_table():
                                    DEFAULT CURRENT_TIMESTAMP
                                    ON UPDATE CURRENT_TIMESTAMP
             """.format(
-                __context__["mysql_kwargs"]["db"], __context__["mysql_table_name"]
+                db_name, table_name
             )
             cur, _ = run_query(__context__["mysql_client"], query)
             cur.close()
@@ -213,9 +215,9 @@ def _create_table():
                   ON UPDATE CURRENT_TIMESTAMP,
       PRIMARY KEY(bank, etcd_key)
     );""".format(
-        __context__["mysql_table_name"]
+        table_name
     )
-    log.info("mysql_cache: creating table %s", __context__["mysql_table_name"])
+    log.info("mysql_cache: creating table %s", table_name)
     cur, _ = run_query(__context__.get("mysql_client"), query)
     cur.close()
 
@@ -225,7 +227,9 @@ def _init_client():
     if __context__.get("mysql_client") is not None:
         return
 
-    opts = copy.deepcopy(__opts__)
+    # Only the mysql.* options are consumed here, a shallow copy of those
+    # avoids deep-copying the whole master configuration
+    opts = {k: v for k, v in __opts__.items() if k.startswith("mysql.")}
     mysql_kwargs = {
         "autocommit": True,
         "host": opts.pop("mysql.host", "127.0.0.1"),
@@ -249,12 +253,11 @@ def _init_client():
 
     # TODO: handle SSL connection parameters
 
-    for k, v in copy.deepcopy(mysql_kwargs).items():
-        if v is None:
-            mysql_kwargs.pop(k)
-    kwargs_copy = mysql_kwargs.copy()
-    kwargs_copy["passwd"] = "<hidden>"
-    log.info("mysql_cache: Setting up client with params: %r", kwargs_copy)
+    mysql_kwargs = {k: v for k, v in mysql_kwargs.items() if v is not None}
+    if log.isEnabledFor(logging.INFO):
+        kwargs_copy = mysql_kwargs.copy()
+        kwargs_copy["passwd"] = "<hidden>"
+        log.info("mysql_cache: Setting up client with params: %r", kwargs_copy)
     __context__["mysql_kwargs"] = mysql_kwargs
     # The MySQL client is created later on by run_query
     _create_table()
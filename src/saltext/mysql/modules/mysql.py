@@ -28,18 +28,18 @@ Module to provide MySQL compatibility to salt.
     Additionally, it is now possible to setup a user with no password.
 """
 
-import copy
+import functools
 import hashlib
 import logging
 import os
 import re
 import shlex
-import sys
 import time
 
 import salt.utils.data
 import salt.utils.files
 import salt.utils.stringutils
+import salt.utils.versions
 
 try:
     # Trying to import MySQLdb
@@ -187,6 +187,16 @@ __all_privileges__ = [
     "XA_RECOVER_ADMIN",
 ]
 
+# Set views of the lists above for validating user input
+_GRANTS = frozenset(__grants__)
+_SSL_OPTIONS = frozenset(__ssl_options__)
+
+_GRANT_SPLIT_RE = re.compile(r"([\w\s]+)(\([^)(]*\))?\s*,?")
+_GRANT_SEPARATOR_RE = re.compile(r"\s*,\s*")
+_STATEMENT_END_RE = re.compile(r"[^-;]+;")
+# Quoting and escape characters stripped before comparing grant identifiers
+_IDENTIFIER_QUOTES = str.maketrans("", "", '"\\`')
+
 # The empty docstring is needed to ignore the developer note during
 # docs rendering (quick fix). There might be better ways.
 
@@ -281,8 +291,9 @@ def __mysql_hash_password(password):
     return _password
 
 
-def __check_table(name, table, **connection_args):
-    dbc = _connect(**connection_args)
+def __check_table(name, table, dbc=None, **connection_args):
+    if dbc is None:
+        dbc = _connect(**connection_args)
     if dbc is None:
         return {}
     cur = dbc.cursor(MySQLdb.cursors.DictCursor)
@@ -296,8 +307,9 @@ def __check_table(name, table, **connection_args):
     return results
 
 
-def __repair_table(name, table, **connection_args):
-    dbc = _connect(**connection_args)
+def __repair_table(name, table, dbc=None, **connection_args):
+    if dbc is None:
+        dbc = _connect(**connection_args)
     if dbc is None:
         return {}
     cur = dbc.cursor(MySQLdb.cursors.DictCursor)
@@ -311,8 +323,9 @@ def __repair_table(name, table, **connection_args):
     return results
 
 
-def __optimize_table(name, table, **connection_args):
-    dbc = _connect(**connection_args)
+def __optimize_table(name, table, dbc=None, **connection_args):
+    if dbc is None:
+        dbc = _connect(**connection_args)
     if dbc is None:
         return {}
     cur = dbc.cursor(MySQLdb.cursors.DictCursor)
@@ -326,11 +339,12 @@ def __optimize_table(name, table, **connection_args):
     return results
 
 
-def __password_column(**connection_args):
+def __password_column(dbc=None, **connection_args):
     if "mysql.password_column" in __context__:
         return __context__["mysql.password_column"]
 
-    dbc = _connect(**connection_args)
+    if dbc is None:
+        dbc = _connect(**connection_args)
     if dbc is None:
         return "Password"
     cur = dbc.cursor()
@@ -349,8 +363,9 @@ def __password_column(**connection_args):
     return __context__["mysql.password_column"]
 
 
-def __get_auth_plugin(user, host, **connection_args):
-    dbc = _connect(**connection_args)
+def __get_auth_plugin(user, host, dbc=None, **connection_args):
+    if dbc is None:
+        dbc = _connect(**connection_args)
     if dbc is None:
         return []
     cur = dbc.cursor(MySQLdb.cursors.DictCursor)
@@ -372,11 +387,24 @@ def __get_auth_plugin(user, host, **connection_args):
         return "mysql_native_password"
 
 
+@functools.lru_cache(maxsize=None)
+def _client_flags():
+    """
+    Map the lowercase names of the MySQL client flags to their values.
+
+    The flags are constants of the client library, so the mapping is built
+    once instead of on every connection.
+    """
+    return {
+        flag.lower(): getattr(CLIENT, flag) for flag in dir(CLIENT) if not flag.startswith("__")
+    }
+
+
 def _connect(**kwargs):
     """
     wrap authentication credentials here
     """
-    connargs = dict()
+    connargs = {}
 
     def _connarg(name, key=None, get_opts=True):
         """
@@ -396,10 +424,7 @@ def _connect(**kwargs):
         elif get_opts:
             prefix = "connection_"
             if name.startswith(prefix):
-                try:
-                    name = name[len(prefix) :]
-                except IndexError:
-                    return
+                name = name[len(prefix) :]
             val = __salt__["config.option"](f"mysql.{name}", None)
             if val is not None:
                 connargs[key] = val
@@ -413,11 +438,7 @@ def _connect(**kwargs):
 
     connargs["client_flag"] = 0
 
-    available_client_flags = {}
-    for flag in dir(CLIENT):
-        if not flag.startswith("__"):
-            available_client_flags[flag.lower()] = getattr(CLIENT, flag)
-
+    available_client_flags = _client_flags()
     for flag in kwargs.get("client_flags", []):
         if available_client_flags.get(flag):
             connargs["client_flag"] |= available_client_flags[flag]
@@ -444,9 +465,7 @@ def _connect(**kwargs):
     # Ensure MySQldb knows the format we use for queries with arguments
     MySQLdb.paramstyle = "pyformat"
 
-    for key in copy.deepcopy(connargs):
-        if not connargs[key]:
-            del connargs[key]
+    connargs = {key: value for key, value in connargs.items() if value}
 
     if connargs.get("passwd", True) is None:  # If present but set to None. (Extreme edge case.)
         log.warning("MySQL password of None found. Attempting passwordless login.")
@@ -468,6 +487,23 @@ def _connect(**kwargs):
     return dbc
 
 
+@functools.lru_cache(maxsize=256)
+def _explode_grant(grant_sql):
+    """
+    Split a GRANT statement into shlex tokens.
+
+    The same statements are tokenized over and over (``grant_exists`` parses
+    every grant of a user and runs again after ``grant_add``), so the result
+    is cached. It is returned as a tuple to keep the cached value immutable.
+    """
+    lex = shlex.shlex(grant_sql)
+    lex.quotes = "'`"
+    lex.whitespace_split = False
+    lex.commenters = ""
+    lex.wordchars += '"'
+    return tuple(lex)
+
+
 def _grant_to_tokens(grant):
     """
 
@@ -532,12 +568,7 @@ def _grant_to_tokens(grant):
     # "GRANT USAGE ON *.* TO 'user \";--,?:&/\\'@'localhost'"
     # ['GRANT', 'USAGE', 'ON', '*', '.', '*', 'TO', '\'user ";--,?:&/\\\'',
     #  '@', "'localhost'"]
-    lex = shlex.shlex(grant_sql)
-    lex.quotes = "'`"
-    lex.whitespace_split = False
-    lex.commenters = ""
-    lex.wordchars += '"'
-    exploded_grant = list(lex)
+    exploded_grant = _explode_grant(grant_sql)
     grant_tokens = []
     multiword_statement = []
     position_tracker = 1  # Skip the initial 'GRANT' word token
@@ -579,11 +610,7 @@ def _grant_to_tokens(grant):
 
         if phrase == "grants":
             # Read-ahead
-            if (
-                exploded_grant[position_tracker + 1] == ","
-                or exploded_grant[position_tracker + 1] == "ON"
-                or exploded_grant[position_tracker + 1] in ["(", ")"]
-            ):
+            if exploded_grant[position_tracker + 1] in (",", "ON", "(", ")"):
                 # End of token detected
                 if multiword_statement:
                     multiword_statement.append(token)
@@ -657,41 +684,29 @@ def _resolve_grant_aliases(grants, server_version):
     mariadb_version_compare_binlog_monitor = "10.5.2"
     mariadb_version_compare_slave_monitor = "10.5.9"
 
-    resolved_tokens = []
-
-    for token in grants:
-        if (
-            salt.utils.versions.version_cmp(
-                server_version, mariadb_version_compare_replication_replica
-            )
-            >= 0
-        ):
-            if token == "REPLICATION REPLICA":
-                # https://mariadb.com/kb/en/grant/#replication-replica
-                resolved_tokens.append("REPLICATION SLAVE")
-                continue
+    # The server version is the same for every token, so work out which
+    # aliases apply once instead of comparing versions per token
+    aliases = {}
+    if (
+        salt.utils.versions.version_cmp(server_version, mariadb_version_compare_replication_replica)
+        >= 0
+    ):
+        # https://mariadb.com/kb/en/grant/#replication-replica
+        aliases["REPLICATION REPLICA"] = "REPLICATION SLAVE"
 
-        if (
-            salt.utils.versions.version_cmp(server_version, mariadb_version_compare_binlog_monitor)
-            >= 0
-        ):
-            if token == "REPLICATION CLIENT":
-                # https://mariadb.com/kb/en/grant/#replication-client
-                resolved_tokens.append("BINLOG MONITOR")
-                continue
+    if salt.utils.versions.version_cmp(server_version, mariadb_version_compare_binlog_monitor) >= 0:
+        # https://mariadb.com/kb/en/grant/#replication-client
+        aliases["REPLICATION CLIENT"] = "BINLOG MONITOR"
 
-        if (
-            salt.utils.versions.version_cmp(server_version, mariadb_version_compare_slave_monitor)
-            >= 0
-        ):
-            if token == "REPLICA MONITOR":
-                # https://mariadb.com/kb/en/grant/#replica-monitor
-                resolved_tokens.append("SLAVE MONITOR")
-                continue
+    if salt.utils.versions.version_cmp(server_version, mariadb_version_compare_slave_monitor) >= 0:
+        # https://mariadb.com/kb/en/grant/#replica-monitor
+        aliases["REPLICA MONITOR"] = "SLAVE MONITOR"
 
-        resolved_tokens.append(token)
+    if not aliases:
+        # None of the aliases exist on this server version
+        return grants
 
-    return resolved_tokens
+    return [aliases.get(token, token) for token in grants]
 
 
 def quote_identifier(identifier, for_grants=False):
@@ -732,12 +747,12 @@ def _execute(cur, qry, args=None):
     predictable way if the query are not always applying the same filters. So
     this wrapper ensure this escape is not made if no arguments are used.
     """
-    if args is None or args == {}:
+    if not args:
         qry = qry.replace("%%", "%")
         log.debug("Doing query: %s", qry)
         return cur.execute(qry)
     else:
-        log.debug("Doing query: %s args: %s ", qry, repr(args))
+        log.debug("Doing query: %s args: %r ", qry, args)
         return cur.execute(qry, args)
 
 
@@ -751,6 +766,34 @@ def _sanitize_comments(content):
     return sqlparse.format(content, strip_comments=True)
 
 
+@functools.lru_cache(maxsize=None)
+def _string_conversions():
+    """
+    Build the converters that stop MySQLdb from converting the MySQL results
+    into Python objects. It leaves them as strings.
+
+    The mapping only depends on the client library, so it is built once.
+    """
+    conv = dict.fromkeys(MySQLdb.converters.conversions, str)
+
+    # some converters are lists, do not break theses
+    conv_mysqldb = {"MYSQLDB": True}
+    if conv_mysqldb.get(MySQLdb.__package__.upper()):
+        conv[FIELD_TYPE.BLOB] = [
+            (FLAG.BINARY, str),
+        ]
+        conv[FIELD_TYPE.STRING] = [
+            (FLAG.BINARY, str),
+        ]
+        conv[FIELD_TYPE.VAR_STRING] = [
+            (FLAG.BINARY, str),
+        ]
+        conv[FIELD_TYPE.VARCHAR] = [
+            (FLAG.BINARY, str),
+        ]
+    return conv
+
+
 def query(database, query, **connection_args):
     """
     Run an arbitrary SQL query and return the results or
@@ -823,29 +866,7 @@ def query(database, query, **connection_args):
     # I don't think it handles multiple queries at once, so adding "commit"
     # might not work.
 
-    # The following 3 lines stops MySQLdb from converting the MySQL results
-    # into Python objects. It leaves them as strings.
-    orig_conv = MySQLdb.converters.conversions
-    conv_iter = iter(orig_conv)
-    conv = dict(zip(conv_iter, [str] * len(orig_conv)))
-
-    # some converters are lists, do not break theses
-    conv_mysqldb = {"MYSQLDB": True}
-    if conv_mysqldb.get(MySQLdb.__package__.upper()):
-        conv[FIELD_TYPE.BLOB] = [
-            (FLAG.BINARY, str),
-        ]
-        conv[FIELD_TYPE.STRING] = [
-            (FLAG.BINARY, str),
-        ]
-        conv[FIELD_TYPE.VAR_STRING] = [
-            (FLAG.BINARY, str),
-        ]
-        conv[FIELD_TYPE.VARCHAR] = [
-            (FLAG.BINARY, str),
-        ]
-
-    connection_args.update({"connection_db": database, "connection_conv": conv})
+    connection_args.update({"connection_db": database, "connection_conv": _string_conversions()})
     dbc = _connect(**connection_args)
     if dbc is None:
         return {}
@@ -868,18 +889,10 @@ def query(database, query, **connection_args):
 
     ret = {}
     ret["query time"] = {"human": elapsed_h, "raw": str(round(elapsed, 5))}
-    select_keywords = ["SELECT", "SHOW", "DESC"]
-    select_query = False
-    for keyword in select_keywords:
-        if query.upper().strip().startswith(keyword):
-            select_query = True
-            break
-    if select_query:
+    select_keywords = ("SELECT", "SHOW", "DESC")
+    if query.upper().strip().startswith(select_keywords):
         ret["rows returned"] = affected
-        columns = ()
-        for column in cur.description:
-            columns += (column[0],)
-        ret["columns"] = columns
+        ret["columns"] = tuple(column[0] for column in cur.description)
         ret["results"] = results
         return ret
     else:
@@ -920,10 +933,7 @@ def file_query(database, file_name, **connection_args):
         log.error("mysql.file_query unavailable, no python sqlparse library installed.")
         return False
 
-    if any(
-        file_name.startswith(proto)
-        for proto in ("salt://", "http://", "https://", "swift://", "s3://")
-    ):
+    if file_name.startswith(("salt://", "http://", "https://", "swift://", "s3://")):
         file_name = __salt__["cp.cache_file"](file_name)
 
     if os.path.exists(file_name):
@@ -933,7 +943,7 @@ def file_query(database, file_name, **connection_args):
         log.error('File "%s" does not exist', file_name)
         return False
 
-    query_string = ""
+    query_lines = []
     ret = {
         "rows returned": 0,
         "columns": [],
@@ -945,12 +955,13 @@ def file_query(database, file_name, **connection_args):
     contents = _sanitize_comments(contents)
     # Walk the each line of the sql file to get accurate row affected results
     for line in contents.splitlines():
-        if not re.search(r"[^-;]+;", line):  # keep appending lines that don't end in ;
-            query_string = query_string + line
+        if not _STATEMENT_END_RE.search(line):  # keep appending lines that don't end in ;
+            query_lines.append(line)
         else:
-            query_string = query_string + line  # append lines that end with ; and run query
-            query_result = query(database, query_string, **connection_args)
-            query_string = ""
+            query_lines.append(line)  # append lines that end with ; and run query
+            # join the statement once instead of re-concatenating it per line
+            query_result = query(database, "".join(query_lines), **connection_args)
+            query_lines = []
 
             if query_result is False:
                 # Fail out on error
@@ -1000,11 +1011,7 @@ def status(**connection_args):
         log.error(err)
         return {}
 
-    ret = {}
-    for _ in range(cur.rowcount):
-        row = cur.fetchone()
-        ret[row[0]] = row[1]
-    return ret
+    return {row[0]: row[1] for row in cur.fetchall()}
 
 
 def version(**connection_args):
@@ -1431,10 +1438,12 @@ def _mysql_user_exists(
     unix_socket=False,
     password_column=None,
     auth_plugin="mysql_native_password",
+    server_version=None,
     **connection_args,
 ):
 
-    server_version = salt.utils.data.decode(version(**connection_args))
+    if server_version is None:
+        server_version = salt.utils.data.decode(version(**connection_args))
     compare_version = "8.0.11"
     qry = "SELECT User,Host FROM mysql.user WHERE User = %(user)s AND Host = %(host)s"
     args = {}
@@ -1539,12 +1548,10 @@ def user_exists(
 
         server_version = salt.utils.data.decode(version(**connection_args))
         if not server_version:
-            last_err = __context__["mysql.error"]
-            err = (
-                "MySQL Error: Unable to fetch current server version. Last error was:"
-                ' "{}"'.format(last_err)
+            log.error(
+                'MySQL Error: Unable to fetch current server version. Last error was: "%s"',
+                __context__["mysql.error"],
             )
-            log.error(err)
             return False
 
     dbc = _connect(**connection_args)
@@ -1565,9 +1572,9 @@ def user_exists(
         return False
 
     if not password_column:
-        password_column = __password_column(**connection_args)
+        password_column = __password_column(dbc=dbc, **connection_args)
 
-    auth_plugin = __get_auth_plugin(user, host, **connection_args)
+    auth_plugin = __get_auth_plugin(user, host, dbc=dbc, **connection_args)
 
     cur = dbc.cursor()
     if "MariaDB" in server_version:
@@ -1592,6 +1599,7 @@ def user_exists(
             unix_socket,
             password_column=password_column,
             auth_plugin=auth_plugin,
+            server_version=server_version,
             **connection_args,
         )
 
@@ -1647,11 +1655,14 @@ def _mysql_user_create(
     unix_socket=False,
     password_column=None,
     auth_plugin="mysql_native_password",
+    server_version=None,
     **connection_args,
 ):
 
-    server_version = salt.utils.data.decode(version(**connection_args))
+    if server_version is None:
+        server_version = salt.utils.data.decode(version(**connection_args))
     compare_version = "8.0.11"
+    identified_with = salt.utils.versions.version_cmp(server_version, compare_version) >= 0
 
     qry = "CREATE USER %(user)s@%(host)s"
     args = {}
@@ -1673,14 +1684,14 @@ def _mysql_user_create(
     else:
         if not salt.utils.data.is_true(allow_passwordless):
             if password is not None:
-                if salt.utils.versions.version_cmp(server_version, compare_version) >= 0:
+                if identified_with:
                     args["auth_plugin"] = auth_plugin
                     qry += " IDENTIFIED WITH %(auth_plugin)s BY %(password)s"
                 else:
                     qry += " IDENTIFIED BY %(password)s"
                 args["password"] = str(password)
             elif password_hash is not None:
-                if salt.utils.versions.version_cmp(server_version, compare_version) >= 0:
+                if identified_with:
                     args["auth_plugin"] = auth_plugin
                     qry += " IDENTIFIED WITH %(auth_plugin)s AS %(password)s"
                 else:
@@ -1808,12 +1819,10 @@ def user_create(
 
         server_version = salt.utils.data.decode(version(**connection_args))
         if not server_version:
-            last_err = __context__["mysql.error"]
-            err = (
-                "MySQL Error: Unable to fetch current server version. Last error was:"
-                ' "{}"'.format(last_err)
+            log.error(
+                'MySQL Error: Unable to fetch current server version. Last error was: "%s"',
+                __context__["mysql.error"],
             )
-            log.error(err)
             return False
 
     if user_exists(user, host, **connection_args):
@@ -1825,7 +1834,7 @@ def user_create(
         return False
 
     if not password_column:
-        password_column = __password_column(**connection_args)
+        password_column = __password_column(dbc=dbc, **connection_args)
 
     cur = dbc.cursor()
     if "MariaDB" in server_version:
@@ -1850,6 +1859,7 @@ def user_create(
             unix_socket,
             password_column=password_column,
             auth_plugin=auth_plugin,
+            server_version=server_version,
             **connection_args,
         )
 
@@ -1886,15 +1896,18 @@ def _mysql_user_chpass(
     unix_socket=None,
     password_column=None,
     auth_plugin="mysql_native_password",
+    server_version=None,
     **connection_args,
 ):
-    server_version = salt.utils.data.decode(version(**connection_args))
+    if server_version is None:
+        server_version = salt.utils.data.decode(version(**connection_args))
     compare_version = "8.0.11"
+    identified_with = salt.utils.versions.version_cmp(server_version, compare_version) >= 0
 
     args = {}
 
     if password is not None:
-        if salt.utils.versions.version_cmp(server_version, compare_version) >= 0:
+        if identified_with:
             password_sql = "%(password)s"
         else:
             password_sql = "PASSWORD(%(password)s)"
@@ -1911,7 +1924,7 @@ def _mysql_user_chpass(
     args["user"] = user
     args["host"] = host
 
-    if salt.utils.versions.version_cmp(server_version, compare_version) >= 0:
+    if identified_with:
         args["auth_plugin"] = auth_plugin
         qry = "ALTER USER %(user)s@%(host)s IDENTIFIED WITH %(auth_plugin)s "
         if password is not None:
@@ -1935,7 +1948,7 @@ def _mysql_user_chpass(
                 qry = False
             else:
                 args["unix_socket"] = "auth_socket"
-                if salt.utils.versions.version_cmp(server_version, compare_version) >= 0:
+                if identified_with:
                     qry = (
                         "ALTER USER %(user)s@%(host)s IDENTIFIED WITH %(unix_socket)s"
                         " AS %(user)s;"
@@ -1964,10 +1977,12 @@ def _mariadb_user_chpass(
     unix_socket=None,
     password_column=None,
     auth_plugin="mysql_native_password",
+    server_version=None,
     **connection_args,
 ):
 
-    server_version = salt.utils.data.decode(version(**connection_args))
+    if server_version is None:
+        server_version = salt.utils.data.decode(version(**connection_args))
     compare_version = "10.4"
 
     args = {}
@@ -2081,12 +2096,10 @@ def user_chpass(
 
         server_version = salt.utils.data.decode(version(**connection_args))
         if not server_version:
-            last_err = __context__["mysql.error"]
-            err = (
-                "MySQL Error: Unable to fetch current server version. Last error was:"
-                ' "{}"'.format(last_err)
+            log.error(
+                'MySQL Error: Unable to fetch current server version. Last error was: "%s"',
+                __context__["mysql.error"],
             )
-            log.error(err)
             return False
 
     if not user_exists(user, host, **connection_args):
@@ -2099,9 +2112,9 @@ def user_chpass(
         return False
 
     if not password_column:
-        password_column = __password_column(**connection_args)
+        password_column = __password_column(dbc=dbc, **connection_args)
 
-    auth_plugin = __get_auth_plugin(user, host, **connection_args)
+    auth_plugin = __get_auth_plugin(user, host, dbc=dbc, **connection_args)
 
     cur = dbc.cursor()
 
@@ -2115,6 +2128,7 @@ def user_chpass(
             unix_socket,
             password_column=password_column,
             auth_plugin=auth_plugin,
+            server_version=server_version,
             **connection_args,
         )
     else:
@@ -2127,6 +2141,7 @@ def user_chpass(
             unix_socket,
             password_column=password_column,
             auth_plugin=auth_plugin,
+            server_version=server_version,
             **connection_args,
         )
 
@@ -2177,7 +2192,7 @@ def user_remove(user, host="localhost", **connection_args):
         salt '*' mysql.user_remove frank localhost
     """
     if not user_exists(user, host, **connection_args):
-        err = "User '%s'@'%s' does not exists", user, host
+        err = f"User '{user}'@'{host}' does not exists"
         __context__["mysql.error"] = err
         log.info(err)
         return False
@@ -2239,9 +2254,11 @@ def db_check(name, table=None, **connection_args):
     if table is None:
         # we need to check all tables
         tables = db_tables(name, **connection_args)
+        # share a single connection across all tables
+        dbc = _connect(**connection_args)
         for table in tables:
             log.info("Checking table '%s' in db '%s'..", name, table)
-            ret.append(__check_table(name, table, **connection_args))
+            ret.append(__check_table(name, table, dbc=dbc, **connection_args))
     else:
         log.info("Checking table '%s' in db '%s'..", name, table)
         ret = __check_table(name, table, **connection_args)
@@ -2262,9 +2279,11 @@ def db_repair(name, table=None, **connection_args):
     if table is None:
         # we need to repair all tables
         tables = db_tables(name, **connection_args)
+        # share a single connection across all tables
+        dbc = _connect(**connection_args)
         for table in tables:
             log.info("Repairing table '%s' in db '%s'..", name, table)
-            ret.append(__repair_table(name, table, **connection_args))
+            ret.append(__repair_table(name, table, dbc=dbc, **connection_args))
     else:
         log.info("Repairing table '%s' in db '%s'..", name, table)
         ret = __repair_table(name, table, **connection_args)
@@ -2285,9 +2304,11 @@ def db_optimize(name, table=None, **connection_args):
     if table is None:
         # we need to optimize all tables
         tables = db_tables(name, **connection_args)
+        # share a single connection across all tables
+        dbc = _connect(**connection_args)
         for table in tables:
             log.info("Optimizing table '%s' in db '%s'..", name, table)
-            ret.append(__optimize_table(name, table, **connection_args))
+            ret.append(__optimize_table(name, table, dbc=dbc, **connection_args))
     else:
         log.info("Optimizing table '%s' in db '%s'..", name, table)
         ret = __optimize_table(name, table, **connection_args)
@@ -2304,15 +2325,14 @@ def __grant_normalize(grant):
     # Grants are paste directly in SQL, must filter it
     exploded_grants = __grant_split(grant)
     for chkgrant, _ in exploded_grants:
-        if chkgrant.strip().upper() not in __grants__:
+        if chkgrant.strip().upper() not in _GRANTS:
             raise ValueError(f"Invalid grant : '{chkgrant}'")
 
     return grant
 
 
 def __grant_split(grant):
-    pattern = re.compile(r"([\w\s]+)(\([^)(]*\))?\s*,?")
-    return pattern.findall(grant)
+    return _GRANT_SPLIT_RE.findall(grant)
 
 
 def __ssl_option_sanitize(ssl_option):
@@ -2320,11 +2340,11 @@ def __ssl_option_sanitize(ssl_option):
 
     # Like most other "salt dsl" YAML structures, ssl_option is a list of single-element dicts
     for opt in ssl_option:
-        key = next(iter(opt.keys()))
+        key = next(iter(opt))
 
         normal_key = key.strip().upper()
 
-        if normal_key not in __ssl_options__:
+        if normal_key not in _SSL_OPTIONS:
             raise ValueError(f"Invalid SSL option : '{key}'")
 
         if normal_key in __ssl_options_parameterized__:
@@ -2355,7 +2375,7 @@ def __grant_generate(
     """
     # TODO: Re-order the grant so it is according to the
     #       SHOW GRANTS for xxx@yyy query (SELECT comes first, etc)
-    grant = re.sub(r"\s*,\s*", ", ", grant).upper()
+    grant = _GRANT_SEPARATOR_RE.sub(", ", grant).upper()
 
     grant = __grant_normalize(grant)
 
@@ -2379,7 +2399,7 @@ def __grant_generate(
         qry += __ssl_option_sanitize(ssl_option)
     if salt.utils.data.is_true(grant_option):
         qry += " WITH GRANT OPTION"
-    log.debug("Grant Query generated: %s args %s", qry, repr(args))
+    log.debug("Grant Query generated: %s args %r", qry, args)
     return {"qry": qry, "args": args}
 
 
@@ -2440,11 +2460,10 @@ def grant_exists(
 
     server_version = salt.utils.data.decode(version(**connection_args))
     if not server_version:
-        last_err = __context__["mysql.error"]
-        err = 'MySQL Error: Unable to fetch current server version. Last error was: "{}"'.format(
-            last_err
+        log.error(
+            'MySQL Error: Unable to fetch current server version. Last error was: "%s"',
+            __context__["mysql.error"],
         )
-        log.error(err)
         return False
     if "ALL" in grant.upper():
         if (
@@ -2452,15 +2471,14 @@ def grant_exists(
             and "MariaDB" not in server_version
             and database == "*.*"
         ):
-            grant = ",".join([i for i in __all_privileges__])
+            grant = ",".join(__all_privileges__)
         else:
             grant = "ALL PRIVILEGES"
 
     try:
         target = __grant_generate(grant, database, user, host, grant_option, escape)
     except Exception as exc:  # pylint: disable=broad-except
-        log.error("Error during grant generation.")
-        log.error(exc)
+        log.error("Error during grant generation: %s", exc)
         return False
 
     grants = user_grants(user, host, **connection_args)
@@ -2482,29 +2500,25 @@ def grant_exists(
                 "user": grant_token["user"],
                 "database": grant_token["database"],
                 "host": grant_token["host"],
-                "grant": grant_token["grant"],
+                "grant": set(grant_token["grant"]),
             }
         else:
-            _grants[grant_token["database"]]["grant"].extend(grant_token["grant"])
+            _grants[grant_token["database"]]["grant"].update(grant_token["grant"])
 
     target_tokens = _grant_to_tokens(target)
     target_tokens["grant"] = _resolve_grant_aliases(target_tokens["grant"], server_version)
+    _target_tokens = {
+        item: target_tokens[item].translate(_IDENTIFIER_QUOTES)
+        for item in ["user", "database", "host"]
+    }
     for database, grant_tokens in _grants.items():
         try:
             _grant_tokens = {}
-            _target_tokens = {}
 
-            _grant_matches = [
-                True if i in grant_tokens["grant"] else False for i in target_tokens["grant"]
-            ]
+            _grant_matches = [i in grant_tokens["grant"] for i in target_tokens["grant"]]
 
             for item in ["user", "database", "host"]:
-                _grant_tokens[item] = (
-                    grant_tokens[item].replace('"', "").replace("\\", "").replace("`", "")
-                )
-                _target_tokens[item] = (
-                    target_tokens[item].replace('"', "").replace("\\", "").replace("`", "")
-                )
+                _grant_tokens[item] = grant_tokens[item].translate(_IDENTIFIER_QUOTES)
 
             if (
                 _grant_tokens["user"] == _target_tokens["user"]
@@ -2675,20 +2689,13 @@ def processlist(**connection_args):
         salt '*' mysql.processlist
 
     """
-    ret = []
-
     dbc = _connect(**connection_args)
     if dbc is None:
         return []
     cur = dbc.cursor()
     _execute(cur, "SHOW FULL PROCESSLIST")
     hdr = [c[0] for c in cur.description]
-    for _ in range(cur.rowcount):
-        row = cur.fetchone()
-        idx_r = {}
-        for idx_j, value_j in enumerate(hdr):
-            idx_r[hdr[idx_j]] = row[idx_j]
-        ret.append(idx_r)
+    ret = [dict(zip(hdr, row)) for row in cur.fetchall()]
     cur.close()
     return ret
 
@@ -2701,7 +2708,7 @@ def __do_query_into_hash(conn, sql_str):
        results in a dict.
 
     """
-    mod = sys._getframe().f_code.co_name
+    mod = "__do_query_into_hash"
     log.debug("%s<--(%s)", mod, sql_str)
 
     rtn_results = []
@@ -2723,15 +2730,10 @@ def __do_query_into_hash(conn, sql_str):
 
     qrs = cursor.fetchall()
 
+    # the column names are the same for every row, resolve them only once
+    col_names = [col_data[0] for col_data in cursor.description]
     for row_data in qrs:
-        col_cnt = 0
-        row = {}
-        for col_data in cursor.description:
-            col_name = col_data[0]
-            row[col_name] = row_data[col_cnt]
-            col_cnt += 1
-
-        rtn_results.append(row)
+        rtn_results.append(dict(zip(col_names, row_data)))
 
     cursor.close()
     log.debug("%s-->", mod)
@@ -2756,7 +2758,7 @@ def get_master_status(**connection_args):
         salt '*' mysql.get_master_status
 
     """
-    mod = sys._getframe().f_code.co_name
+    mod = "get_master_status"
     log.debug("%s<--", mod)
     conn = _connect(**connection_args)
     if conn is None:
@@ -2826,7 +2828,7 @@ def get_slave_status(**connection_args):
         salt '*' mysql.get_slave_status
 
     """
-    mod = sys._getframe().f_code.co_name
+    mod = "get_slave_status"
     log.debug("%s<--", mod)
     conn = _connect(**connection_args)
     if conn is None:
@@ -2856,7 +2858,7 @@ def showvariables(**connection_args):
         salt '*' mysql.showvariables
 
     """
-    mod = sys._getframe().f_code.co_name
+    mod = "showvariables"
     log.debug("%s<--", mod)
     conn = _connect(**connection_args)
     if conn is None:
@@ -2884,7 +2886,7 @@ def showglobal(**connection_args):
         salt '*' mysql.showglobal
 
     """
-    mod = sys._getframe().f_code.co_name
+    mod = "showglobal"
     log.debug("%s<--", mod)
     conn = _connect(**connection_args)
     if conn is None:
@@ -141,10 +141,12 @@ To override individual configuration items, append --return_kwargs '{"key:": "va
 import logging
 import sys
 from contextlib import contextmanager
+from contextlib import suppress
 
 import salt.exceptions
 import salt.returners
 import salt.utils.data
+import salt.utils.jid
 import salt.utils.job
 import salt.utils.json
 
@@ -231,8 +233,6 @@ def _get_serv(ret=None, commit=False):
     """
     Return a mysql cursor
     """
-    _options = _get_options(ret)
-
     connect = True
     if __context__ and "mysql_returner_conn" in __context__:
         try:
@@ -245,6 +245,7 @@ def _get_serv(ret=None, commit=False):
 
     if connect:
         log.debug("Generating new MySQL connection pool")
+        _options = _get_options(ret)
         try:
             # An empty ssl_options dictionary passed to MySQLdb.connect will
             # effectively connect w/o SSL.
@@ -264,10 +265,8 @@ def _get_serv(ret=None, commit=False):
                 ssl=ssl_options,
             )
 
-            try:
+            with suppress(TypeError):
                 __context__["mysql_returner_conn"] = conn
-            except TypeError:
-                pass
         except OperationalError as exc:
             raise salt.exceptions.SaltMasterError(
                 f"MySQL returner could not connect to database: {exc}"
@@ -328,13 +327,18 @@ def event_return(events):
     Requires that configuration be enabled via 'event_return'
     option in master config.
     """
+    if not events:
+        return
     with _get_serv(events, commit=True) as cur:
-        for event in events:
-            tag = event.get("tag", "")
-            data = event.get("data", "")
-            sql = """INSERT INTO `salt_events` (`tag`, `data`, `master_id`)
-                     VALUES (%s, %s, %s)"""
-            cur.execute(sql, (tag, salt.utils.json.dumps(data), __opts__["id"]))
+        sql = """INSERT INTO `salt_events` (`tag`, `data`, `master_id`)
+                 VALUES (%s, %s, %s)"""
+        cur.executemany(
+            sql,
+            [
+                (event.get("tag", ""), salt.utils.json.dumps(event.get("data", "")), __opts__["id"])
+                for event in events
+            ],
+        )
 
 
 def save_load(jid, load, minions=None):
@@ -499,8 +503,10 @@ def _purge_jobs(timestamp):
             cur.execute(sql, (timestamp,))
             cur.execute("COMMIT")
         except MySQLdb.Error as e:
-            log.error("mysql returner archiver was unable to delete contents of table 'jids'")
-            log.error(str(e))
+            log.error(
+                "mysql returner archiver was unable to delete contents of table 'jids': %s",
+                e,
+            )
             raise salt.exceptions.SaltRunnerError(str(e))
 
         try:
@@ -509,9 +515,9 @@ def _purge_jobs(timestamp):
             cur.execute("COMMIT")
         except MySQLdb.Error as e:
             log.error(
-                "mysql returner archiver was unable to delete contents of table 'salt_returns'"
+                "mysql returner archiver was unable to delete contents of table 'salt_returns': %s",
+                e,
             )
-            log.error(str(e))
             raise salt.exceptions.SaltRunnerError(str(e))
 
         try:
@@ -520,9 +526,9 @@ def _purge_jobs(timestamp):
             cur.execute("COMMIT")
         except MySQLdb.Error as e:
             log.error(
-                "mysql returner archiver was unable to delete contents of table 'salt_events'"
+                "mysql returner archiver was unable to delete contents of table 'salt_events': %s",
+                e,
             )
-            log.error(str(e))
             raise salt.exceptions.SaltRunnerError(str(e))
 
     return True
@@ -546,8 +552,7 @@ def _archive_jobs(timestamp):
                 cur.execute("COMMIT")
                 target_tables[table_name] = tmp_table_name
             except MySQLdb.Error as e:
-                log.error("mysql returner archiver was unable to create the archive tables.")
-                log.error(str(e))
+                log.error("mysql returner archiver was unable to create the archive tables: %s", e)
                 raise salt.exceptions.SaltRunnerError(str(e))
 
         try:
@@ -558,8 +563,7 @@ def _archive_jobs(timestamp):
             cur.execute(sql, (timestamp,))
             cur.execute("COMMIT")
         except MySQLdb.Error as e:
-            log.error("mysql returner archiver was unable to copy contents of table 'jids'")
-            log.error(str(e))
+            log.error("mysql returner archiver was unable to copy contents of table 'jids': %s", e)
             raise salt.exceptions.SaltRunnerError(str(e))
         except Exception as e:  # pylint: disable=broad-except
             log.error(e)
@@ -572,8 +576,10 @@ def _archive_jobs(timestamp):
             cur.execute(sql, (timestamp,))
             cur.execute("COMMIT")
         except MySQLdb.Error as e:
-            log.error("mysql returner archiver was unable to copy contents of table 'salt_returns'")
-            log.error(str(e))
+            log.error(
+                "mysql returner archiver was unable to copy contents of table 'salt_returns': %s",
+                e,
+            )
             raise salt.exceptions.SaltRunnerError(str(e))
 
         try:
@@ -583,8 +589,10 @@ def _archive_jobs(timestamp):
             cur.execute(sql, (timestamp,))
             cur.execute("COMMIT")
         except MySQLdb.Error as e:
-            log.error("mysql returner archiver was unable to copy contents of table 'salt_events'")
-            log.error(str(e))
+            log.error(
+                "mysql returner archiver was unable to copy contents of table 'salt_events': %s",
+                e,
+            )
             raise salt.exceptions.SaltRunnerError(str(e))
 
     return _purge_jobs(timestamp)
@@ -612,6 +620,5 @@ def clean_old_jobs():
             else:
                 _purge_jobs(stamp)
         except MySQLdb.Error as e:
-            log.error("Mysql returner was unable to get timestamp for purge/archive of jobs")
-            log.error(str(e))
+            log.error("Mysql returner was unable to get timestamp for purge/archive of jobs: %s", e)
             raise salt.exceptions.SaltRunnerError(str(e))
@@ -113,12 +113,7 @@ def run_file(
         ret["result"] = False
         return ret
 
-    if any(
-        [
-            query_file.startswith(proto)
-            for proto in ["http://", "https://", "salt://", "s3://", "swift://"]
-        ]
-    ):
+    if query_file.startswith(("http://", "https://", "salt://", "s3://", "swift://")):
         query_file = __salt__["cp.cache_file"](query_file, saltenv=saltenv or __env__)
 
     if not os.path.exists(query_file):
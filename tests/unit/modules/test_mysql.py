@@ -446,6 +446,24 @@ def test_db_check():
     )
 
 
+def test_db_check_all_tables_single_connection():
+    """
+    Test that checking a whole database reuses a single connection
+    """
+    connect_mock = MagicMock()
+    with patch.object(mysql, "_connect", connect_mock):
+        with patch.object(mysql, "db_tables", MagicMock(return_value=["first", "second"])):
+            ret = mysql.db_check("testdb")
+    assert len(ret) == 2
+    connect_mock.assert_called_once_with()
+    connect_mock.return_value.cursor().execute.assert_has_calls(
+        [
+            call("CHECK TABLE `testdb`.`first`"),
+            call("CHECK TABLE `testdb`.`second`"),
+        ]
+    )
+
+
 def test_db_repair():
     """
     Test MySQL db repair function in mysql exec module
@@ -648,6 +666,25 @@ def test_grant_exists_all():
             assert ret
 
 
+def test_resolve_grant_aliases():
+    """
+    Test that grant aliases are only resolved on MariaDB versions that know them
+    """
+    grants = ["SELECT", "REPLICATION REPLICA", "REPLICATION CLIENT", "REPLICA MONITOR"]
+
+    ret = mysql._resolve_grant_aliases(grants, "8.0.11")
+    assert ret == grants
+
+    ret = mysql._resolve_grant_aliases(grants, "10.4.30-MariaDB")
+    assert ret == grants
+
+    ret = mysql._resolve_grant_aliases(grants, "10.5.2-MariaDB")
+    assert ret == ["SELECT", "REPLICATION SLAVE", "BINLOG MONITOR", "REPLICA MONITOR"]
+
+    ret = mysql._resolve_grant_aliases(grants, "10.11.6-MariaDB")
+    assert ret == ["SELECT", "REPLICATION SLAVE", "BINLOG MONITOR", "SLAVE MONITOR"]
+
+
 @pytest.mark.skipif(True, reason="TODO: Mock up user_grants()")
 def test_grant_add():
     """